@@ -1,114 +1,213 @@
 """
 Container management functionality for Docker service manager.
 """
+import atexit
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple
 
-try:
-    import docker
-    from docker.errors import DockerException
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
+# docker itself is imported lazily via get_docker_client() so demo mode
+# and --version never pay the SDK's import cost
+from .docker_client import get_docker_client
+from ..utils.display import print_status, write_raw
 
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+# Demo-mode output never changes, so the banners are encoded once at
+# import and written as raw bytes, and the sample rows are shared
+_DEMO_LIST_BANNER = b"\x1b[93mDEMO MODE\x1b[0m: Simulating container list\n"
+_DEMO_REMOVE_PREFIX = b"\x1b[93mDEMO MODE\x1b[0m: Simulating container removal "
+_DEMO_PRUNE_BANNER = b"\x1b[93mDEMO MODE\x1b[0m: Simulating container pruning\n"
+
+# Status and image strings repeat across containers ("running",
+# "nginx:latest", ...); interning them makes every row share one object
+_intern = sys.intern
+
+_DEMO_CONTAINERS = [
+    {
+        "ID": "abc123",
+        "Name": "web-server",
+        "Status": "running",
+        "Image": "nginx:latest",
+        "Created": "2 hours ago"
+    },
+    {
+        "ID": "def456",
+        "Name": "db-server",
+        "Status": "stopped",
+        "Image": "postgres:13",
+        "Created": "1 day ago"
+    }
+]
 
 
 class ContainerManager:
     """Container management functionality for Docker."""
     
-    def __init__(self, demo_mode: bool = False):
+    def __init__(self, demo_mode: bool = False, client: Optional[Any] = None):
         """Initialize container manager.
-        
+
         Args:
             demo_mode: Whether to use demo mode with simulated responses
+            client: Optional shared Docker client; when omitted the
+                module-wide shared client is used
         """
         self.demo_mode = demo_mode
-        self.client = None if demo_mode else docker.from_env()
-        
+        self.client = None if demo_mode else (client or get_docker_client())
+        # Short-lived cache of list results: all_flag -> (timestamp, rows)
+        self._cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+        # Lazily created worker pool for background removals
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    # How long list results stay fresh, in seconds
+    CACHE_TTL = 2.0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the removal worker pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4)
+            atexit.register(self._pool.shutdown, wait=True)
+        return self._pool
+
+    @staticmethod
+    def _log_async_error(future: Future) -> None:
+        """Report a failed background removal."""
+        exc = future.exception()
+        if exc is not None:
+            print_status(f"Background removal failed: {exc}", "error")
+
+    @staticmethod
+    def _container_row(c: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a display row from a raw low-level API container dict.
+
+        Args:
+            c: Raw container payload from the /containers/json endpoint
+
+        Returns:
+            Container dictionary for display
+        """
+        return {
+            "ID": c['Id'][:12],
+            "Name": c['Names'][0].lstrip('/') if c.get('Names') else c['Id'][:12],
+            "Status": _intern(c.get('State', 'unknown')),
+            "Image": _intern(c.get('Image', '<none>')),
+            "Created": datetime.fromtimestamp(c['Created']).strftime('%Y-%m-%d %H:%M:%S')
+        }
+
     def list_containers(self, all_containers: bool = False) -> List[Dict[str, Any]]:
         """List all containers.
-        
+
+        Results are cached briefly so adjacent menu actions don't issue
+        redundant Docker API round-trips.
+
         Args:
             all_containers: Whether to show all containers (including stopped ones)
-            
+
         Returns:
             List of container dictionaries
         """
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating container list")
-            return [
-                {
-                    "ID": "abc123",
-                    "Name": "web-server",
-                    "Status": "running",
-                    "Image": "nginx:latest",
-                    "Created": "2 hours ago"
-                },
-                {
-                    "ID": "def456",
-                    "Name": "db-server",
-                    "Status": "stopped",
-                    "Image": "postgres:13",
-                    "Created": "1 day ago"
-                }
-            ]
-            
+            write_raw(_DEMO_LIST_BANNER)
+            return _DEMO_CONTAINERS
+
+        cached = self._cache.get(all_containers)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
+        from docker.errors import DockerException
+
         try:
-            containers = self.client.containers.list(all=all_containers)
-            return [
-                {
-                    "ID": c.id[:12],
-                    "Name": c.name,
-                    "Status": c.status,
-                    "Image": c.image.tags[0] if c.image.tags else c.image.id[:12],
-                    "Created": c.attrs['Created']
-                }
-                for c in containers
-            ]
+            # The low-level endpoint returns every needed field in one
+            # HTTP call, avoiding docker-py's lazy per-model inspects
+            containers = self.client.api.containers(all=all_containers)
+            rows = [self._container_row(c) for c in containers]
+            self._cache[all_containers] = (time.monotonic(), rows)
+            return rows
         except DockerException as e:
             print(f"Error listing containers: {str(e)}")
             return []
             
-    def remove_container(self, container_id: str, force: bool = False) -> bool:
-        """Remove a container.
-        
+    def _do_remove(self, container_id: str, force: bool) -> None:
+        """Remove a container synchronously (runs on the worker pool).
+
+        Issues a single DELETE through the low-level API; the old
+        get-then-remove dance cost an extra inspect round-trip just to
+        build a model object that was thrown away.
+        """
+        from docker.errors import NotFound
+
+        try:
+            self.client.api.remove_container(container_id, force=force)
+        except NotFound:
+            raise RuntimeError(f"No such container: {container_id}")
+        self._cache.clear()
+
+    def _do_prune(self, filters: Optional[Dict[str, Any]]) -> None:
+        """Prune stopped containers synchronously (runs on the worker pool)."""
+        self.client.containers.prune(filters=filters)
+        self._cache.clear()
+
+    def remove_container(self, container_id: str, force: bool = False) -> Optional[Future]:
+        """Schedule removal of a container on the worker pool.
+
+        Removal can take tens of seconds, so it runs in the background;
+        failures are reported asynchronously via print_status.
+
         Args:
             container_id: Container ID or name
             force: Whether to force remove (kill if running)
-            
+
         Returns:
-            True if successful, False otherwise
+            Future for the removal, or None in demo mode
         """
         if self.demo_mode:
-            print(f"\033[93mDEMO MODE\033[0m: Simulating container removal '{container_id}'")
-            return True
-            
-        try:
-            container = self.client.containers.get(container_id)
-            container.remove(force=force)
-            return True
-        except DockerException as e:
-            print(f"Error removing container: {str(e)}")
-            return False
-            
-    def prune_containers(self) -> bool:
-        """Remove all stopped containers.
-        
+            write_raw(_DEMO_REMOVE_PREFIX + f"'{container_id}'\n".encode('utf-8'))
+            return None
+
+        future = self._get_pool().submit(self._do_remove, container_id, force)
+        future.add_done_callback(self._log_async_error)
+        return future
+
+    def remove_containers(self, container_ids: List[str], force: bool = False) -> List[Future]:
+        """Schedule removal of several containers concurrently.
+
+        Deletes fan out over the worker pool, so total latency is roughly
+        ceil(N / workers) removals instead of N sequential ones.
+
+        Args:
+            container_ids: Container IDs or names
+            force: Whether to force remove (kill if running)
+
         Returns:
-            True if successful, False otherwise
+            List of Futures, one per container (empty in demo mode)
         """
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating container pruning")
-            return True
-            
-        try:
-            self.client.containers.prune()
-            return True
-        except DockerException as e:
-            print(f"Error pruning containers: {str(e)}")
-            return False 
\ No newline at end of file
+            for container_id in container_ids:
+                write_raw(_DEMO_REMOVE_PREFIX + f"'{container_id}'\n".encode('utf-8'))
+            return []
+
+        futures = []
+        for container_id in container_ids:
+            future = self._get_pool().submit(self._do_remove, container_id, force)
+            future.add_done_callback(self._log_async_error)
+            futures.append(future)
+        return futures
+
+    def prune_containers(self, filters: Optional[Dict[str, Any]] = None) -> Optional[Future]:
+        """Schedule removal of all stopped containers on the worker pool.
+
+        Args:
+            filters: Optional daemon-side prune filters (e.g.
+                ``{'until': '24h'}``), applied server-side so no
+                client-side listing is needed
+
+        Returns:
+            Future for the prune, or None in demo mode
+        """
+        if self.demo_mode:
+            write_raw(_DEMO_PRUNE_BANNER)
+            return None
+
+        future = self._get_pool().submit(self._do_prune, filters)
+        future.add_done_callback(self._log_async_error)
+        return future 
\ No newline at end of file
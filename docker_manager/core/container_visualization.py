@@ -99,9 +99,11 @@ class ContainerVisualizer:
                 {'id': 'jkl012', 'name': 'demo-backup', 'state': 'exited', 'image': 'alpine:latest'}
             ]
             
-        # Connect to Docker for real container data
+        # Connect to Docker for real container data (shared client, so
+        # repeat visualizations reuse the same connection)
         try:
-            client = docker.from_env()
+            from .docker_client import get_docker_client
+            client = get_docker_client()
             containers = client.containers.list(all=True)
             
             return [
@@ -0,0 +1,77 @@
+"""
+Shared Docker client handling for Docker service manager.
+
+Provides a single long-lived Docker client that can be shared across
+managers, avoiding repeated Unix-socket/HTTP connection setup when
+several managers are created in the same session.
+"""
+import atexit
+import os
+import threading
+from typing import Optional, Any
+
+# The docker SDK pulls in requests/urllib3/websocket and is a measurable
+# chunk of CLI startup time, so it is imported lazily on first use.
+_docker_module: Optional[Any] = None
+
+# Socket timeout for daemon calls, in seconds. Long by default so slow
+# prune/remove operations finish instead of timing out and being retried;
+# override with the DCKRMGRTL_DOCKER_TIMEOUT environment variable.
+try:
+    DOCKER_TIMEOUT = int(os.environ.get('DCKRMGRTL_DOCKER_TIMEOUT', '600'))
+except ValueError:
+    DOCKER_TIMEOUT = 600
+
+_client: Optional[Any] = None
+_client_lock = threading.Lock()
+
+
+def get_docker_module() -> Any:
+    """Import and cache the docker SDK on first use.
+
+    Returns:
+        The imported docker module
+
+    Raises:
+        RuntimeError: If the Docker Python SDK is not installed
+    """
+    global _docker_module
+
+    if _docker_module is None:
+        try:
+            import docker
+        except ImportError:
+            raise RuntimeError("Docker Python SDK not installed")
+        _docker_module = docker
+    return _docker_module
+
+
+def get_docker_client() -> Any:
+    """Get the shared Docker client, creating it on first use.
+
+    The client is memoized so all callers share one connection pool;
+    it is closed automatically at interpreter exit.
+
+    Returns:
+        Shared docker.DockerClient instance
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = get_docker_module().from_env(timeout=DOCKER_TIMEOUT)
+            atexit.register(close_docker_client)
+    return _client
+
+
+def close_docker_client() -> None:
+    """Close the shared Docker client if it was created."""
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            try:
+                _client.close()
+            except Exception:
+                pass
+            _client = None
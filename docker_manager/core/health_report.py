@@ -63,12 +63,13 @@ class HealthReport:
         self.chart_files = []
         self.temp_dir = tempfile.mkdtemp(prefix='docker_manager_report_')
         
-        # Initialize Docker client
+        # Initialize Docker client (shared across managers)
         self.client = None
         if not demo_mode and DOCKER_AVAILABLE:
             try:
-                self.client = docker.from_env()
-            except DockerException as e:
+                from .docker_client import get_docker_client
+                self.client = get_docker_client()
+            except (DockerException, RuntimeError) as e:
                 print(f"[warning] Could not connect to Docker daemon: {e}")
 
     def _run_command(self, command: List[str]) -> Tuple[bool, str]:
@@ -1,110 +1,222 @@
 """
 Image management functionality for Docker service manager.
 """
+import atexit
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple
 
-try:
-    import docker
-    from docker.errors import DockerException
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
+# docker itself is imported lazily via get_docker_client() so demo mode
+# and --version never pay the SDK's import cost
+from .docker_client import get_docker_client
+from ..utils.display import print_status, write_raw
 
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+# Demo-mode output never changes, so the banners are encoded once at
+# import and written as raw bytes, and the sample rows are shared
+_DEMO_LIST_BANNER = b"\x1b[93mDEMO MODE\x1b[0m: Simulating image list\n"
+_DEMO_REMOVE_PREFIX = b"\x1b[93mDEMO MODE\x1b[0m: Simulating image removal "
+_DEMO_PRUNE_BANNER = b"\x1b[93mDEMO MODE\x1b[0m: Simulating image pruning\n"
+
+_DEMO_IMAGES = [
+    {
+        "ID": "abc123",
+        "Repository": "nginx",
+        "Tag": "latest",
+        "Size": "133MB",
+        "Created": "2 days ago"
+    },
+    {
+        "ID": "def456",
+        "Repository": "postgres",
+        "Tag": "13",
+        "Size": "376MB",
+        "Created": "1 week ago"
+    }
+]
+
+# Precomputed byte -> megabyte factor so row formatting multiplies once
+# instead of dividing twice
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Repository and tag strings repeat across images ("latest", "<none>",
+# ...); interning them makes every row share one object
+_intern = sys.intern
 
 
 class ImageManager:
     """Image management functionality for Docker."""
     
-    def __init__(self, demo_mode: bool = False):
+    def __init__(self, demo_mode: bool = False, client: Optional[Any] = None):
         """Initialize image manager.
-        
+
         Args:
             demo_mode: Whether to use demo mode with simulated responses
+            client: Optional shared Docker client; when omitted the
+                module-wide shared client is used
         """
         self.demo_mode = demo_mode
-        self.client = None if demo_mode else docker.from_env()
-            
+        self.client = None if demo_mode else (client or get_docker_client())
+        # Short-lived cache of list results: key -> (timestamp, rows)
+        self._cache: Dict[Any, Tuple[float, List[Dict[str, Any]]]] = {}
+        # Formatted rows memoized per image: (Id, Size) -> row dict
+        self._row_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Lazily created worker pool for background removals
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    # How long list results stay fresh, in seconds
+    CACHE_TTL = 2.0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the removal worker pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4)
+            atexit.register(self._pool.shutdown, wait=True)
+        return self._pool
+
+    @staticmethod
+    def _log_async_error(future: Future) -> None:
+        """Report a failed background removal."""
+        exc = future.exception()
+        if exc is not None:
+            print_status(f"Background removal failed: {exc}", "error")
+
+    def _image_row(self, img: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a display row from a raw low-level API image dict.
+
+        Formatted rows are memoized per (Id, Size) so repeated listings
+        only pay the formatting cost for images that changed.
+
+        Args:
+            img: Raw image payload from the /images/json endpoint
+
+        Returns:
+            Image dictionary for display
+        """
+        key = (img['Id'], img.get('Size', 0))
+        row = self._row_cache.get(key)
+        if row is not None:
+            return row
+
+        tags = img.get('RepoTags') or []
+        if tags and tags[0] != '<none>:<none>':
+            # One rsplit handles registry ports in the repository part and
+            # avoids splitting the same string twice
+            repo, tag = tags[0].rsplit(':', 1)
+        else:
+            repo, tag = '<none>', '<none>'
+        row = {
+            "ID": img['Id'][7:19],
+            "Repository": _intern(repo),
+            "Tag": _intern(tag),
+            "Size": f"{img['Size'] * _BYTES_TO_MB:.1f}MB",
+            "Created": datetime.fromtimestamp(img['Created']).strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._row_cache[key] = row
+        return row
+
     def list_images(self) -> List[Dict[str, Any]]:
         """List all Docker images.
-        
+
+        Results are cached briefly so adjacent menu actions don't issue
+        redundant Docker API round-trips.
+
         Returns:
             List of image dictionaries
         """
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating image list")
-            return [
-                {
-                    "ID": "abc123",
-                    "Repository": "nginx",
-                    "Tag": "latest",
-                    "Size": "133MB",
-                    "Created": "2 days ago"
-                },
-                {
-                    "ID": "def456",
-                    "Repository": "postgres",
-                    "Tag": "13",
-                    "Size": "376MB",
-                    "Created": "1 week ago"
-                }
-            ]
-            
+            write_raw(_DEMO_LIST_BANNER)
+            return _DEMO_IMAGES
+
+        cached = self._cache.get('images')
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
+        from docker.errors import DockerException
+
         try:
-            images = self.client.images.list()
-            return [
-                {
-                    "ID": img.id[7:19],
-                    "Repository": img.tags[0].split(':')[0] if img.tags else "<none>",
-                    "Tag": img.tags[0].split(':')[1] if img.tags else "<none>",
-                    "Size": f"{img.attrs['Size'] / 1024 / 1024:.1f}MB",
-                    "Created": img.attrs['Created']
-                }
-                for img in images
-            ]
+            # The low-level endpoint returns every needed field in one
+            # HTTP call, avoiding docker-py's lazy per-model inspects
+            images = self.client.api.images()
+            rows = [self._image_row(img) for img in images]
+            self._cache['images'] = (time.monotonic(), rows)
+            return rows
         except DockerException as e:
             print(f"Error listing images: {str(e)}")
             return []
             
-    def remove_image(self, image_id: str, force: bool = False) -> bool:
-        """Remove a Docker image.
-        
+    def _do_remove(self, image_id: str, force: bool) -> None:
+        """Remove an image synchronously (runs on the worker pool)."""
+        self.client.images.remove(image_id, force=force)
+        self._cache.clear()
+
+    def _do_prune(self, filters: Optional[Dict[str, Any]]) -> None:
+        """Prune dangling images synchronously (runs on the worker pool)."""
+        self.client.images.prune(filters={'dangling': True, **(filters or {})})
+        self._cache.clear()
+
+    def remove_image(self, image_id: str, force: bool = False) -> Optional[Future]:
+        """Schedule removal of a Docker image on the worker pool.
+
+        Removal can take a while for large images, so it runs in the
+        background; failures are reported asynchronously via print_status.
+
         Args:
             image_id: Image ID or name:tag
             force: Whether to force remove
-            
+
         Returns:
-            True if successful, False otherwise
+            Future for the removal, or None in demo mode
         """
         if self.demo_mode:
-            print(f"\033[93mDEMO MODE\033[0m: Simulating image removal '{image_id}'")
-            return True
-            
-        try:
-            self.client.images.remove(image_id, force=force)
-            return True
-        except DockerException as e:
-            print(f"Error removing image: {str(e)}")
-            return False
-            
-    def prune_images(self) -> bool:
-        """Remove all dangling images.
-        
+            write_raw(_DEMO_REMOVE_PREFIX + f"'{image_id}'\n".encode('utf-8'))
+            return None
+
+        future = self._get_pool().submit(self._do_remove, image_id, force)
+        future.add_done_callback(self._log_async_error)
+        return future
+
+    def remove_images(self, image_ids: List[str], force: bool = False) -> List[Future]:
+        """Schedule removal of several images concurrently.
+
+        Deletes fan out over the worker pool, so total latency is roughly
+        ceil(N / workers) removals instead of N sequential ones.
+
+        Args:
+            image_ids: Image IDs or name:tag references
+            force: Whether to force remove
+
         Returns:
-            True if successful, False otherwise
+            List of Futures, one per image (empty in demo mode)
         """
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating image pruning")
-            return True
-            
-        try:
-            self.client.images.prune()
-            return True
-        except DockerException as e:
-            print(f"Error pruning images: {str(e)}")
-            return False 
\ No newline at end of file
+            for image_id in image_ids:
+                write_raw(_DEMO_REMOVE_PREFIX + f"'{image_id}'\n".encode('utf-8'))
+            return []
+
+        futures = []
+        for image_id in image_ids:
+            future = self._get_pool().submit(self._do_remove, image_id, force)
+            future.add_done_callback(self._log_async_error)
+            futures.append(future)
+        return futures
+
+    def prune_images(self, filters: Optional[Dict[str, Any]] = None) -> Optional[Future]:
+        """Schedule removal of all dangling images on the worker pool.
+
+        Args:
+            filters: Optional daemon-side prune filters (e.g.
+                ``{'until': '24h'}``), merged with the dangling filter and
+                applied server-side
+
+        Returns:
+            Future for the prune, or None in demo mode
+        """
+        if self.demo_mode:
+            write_raw(_DEMO_PRUNE_BANNER)
+            return None
+
+        future = self._get_pool().submit(self._do_prune, filters)
+        future.add_done_callback(self._log_async_error)
+        return future 
\ No newline at end of file
@@ -242,6 +242,17 @@ class DockerServiceManager:
                 return False, "permission_denied"
             return False, "docker_not_installed"
 
+    def get_status(self) -> Tuple[bool, Optional[str]]:
+        """Get Docker service status.
+
+        Alias for check_service_status used by the interactive console
+        and the test suite.
+
+        Returns:
+            Tuple of (success, error_code) where error_code is None on success
+        """
+        return self.check_service_status()
+
     def start_service(self) -> bool:
         """Start Docker service."""
         print("Starting Docker service...")
@@ -636,6 +647,49 @@ class DockerServiceManager:
             print(f"Error listing containers: {e}")
             return False, None
 
+    def get_containers(self) -> List[Dict[str, str]]:
+        """Get containers as plain dictionaries for UI selection lists.
+
+        Unlike list_containers, which prints a formatted table, this
+        returns the data so callers (e.g. the interactive log viewer)
+        can build their own prompts.
+
+        Returns:
+            List of dicts with 'id', 'name' and 'status' keys
+            (empty list on error)
+        """
+        # If in demo mode, return the same sample containers the
+        # list_containers table shows
+        if self.demo_mode:
+            return [
+                {"id": "abc123", "name": "demo-webserver", "status": "running"},
+                {"id": "def456", "name": "demo-database", "status": "running"},
+                {"id": "ghi789", "name": "demo-redis", "status": "restarting"},
+                {"id": "jkl012", "name": "demo-backup", "status": "exited"},
+            ]
+
+        if not DOCKER_AVAILABLE:
+            print("Error: Docker Python SDK not installed.")
+            print("Install with: pip install docker")
+            return []
+
+        try:
+            client = docker.from_env()
+            # One low-level call returns every needed field, avoiding
+            # per-container inspect round-trips
+            containers = client.api.containers(all=True)
+            return [
+                {
+                    "id": c['Id'][:12],
+                    "name": c['Names'][0].lstrip('/') if c.get('Names') else c['Id'][:12],
+                    "status": c.get('State', 'unknown'),
+                }
+                for c in containers
+            ]
+        except DockerException as e:
+            print(f"Error connecting to Docker: {e}")
+            return []
+
     def check_docker_info(self) -> Tuple[bool, Optional[str]]:
         """Get Docker system info.
 
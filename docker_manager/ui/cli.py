@@ -4,7 +4,8 @@ Command-line interface for Docker service manager.
 import argparse
 import sys
 import os
-from typing import List, Dict, Optional, Any, Tuple
+import threading
+from typing import Callable, List, Dict, Optional, Any, Tuple
 
 # Core imports
 from ..core.service_manager import DockerServiceManager
@@ -12,18 +13,116 @@ from ..core.health_report import HealthReport
 from ..core.container_logs import ContainerLogs
 from ..core.container_manager import ContainerManager
 from ..core.image_manager import ImageManager
+from ..core.docker_client import get_docker_client
 
 # UI imports
-from ..utils.display import show_banner, print_status
+from ..utils.display import show_banner, print_status, render_table, confirm
 
 # Package imports
 from .. import __version__
 
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+# At most one speculative listing refresh in flight at a time
+_prefetch_lock = threading.Lock()
+
+def _prefetch(refresh: Callable[[], Any]) -> None:
+    """Run a listing refresh on a background thread.
+
+    The interactive loop is human-latency bound, so the seconds the user
+    spends reading a menu are used to warm the manager's list cache for
+    the next selection. At most one prefetch runs at a time.
+
+    Args:
+        refresh: Zero-argument callable that repopulates a list cache
+    """
+    if not _prefetch_lock.acquire(blocking=False):
+        return
+
+    def _work() -> None:
+        try:
+            refresh()
+        except Exception:
+            pass
+        finally:
+            _prefetch_lock.release()
+
+    threading.Thread(target=_work, daemon=True).start()
+
+# Menu text is static, so each menu is assembled once at import time and
+# written in a single call instead of re-printing line by line every loop
+_MAIN_MENU = (
+    "\n=== Main Menu ===\n"
+    "-----------------\n"
+    "1. Service Management\n"
+    "2. Socket Management\n"
+    "3. Container Management\n"
+    "4. Image Management\n"
+    "5. System Information\n"
+    "6. Generate Health Report\n"
+    "q. Quit\n"
+)
+
+_CONTAINER_MENU = (
+    "\n=== Container Management ===\n"
+    "---------------------------\n"
+    "1. List Running Containers\n"
+    "2. List All Containers\n"
+    "3. Remove Container(s)\n"
+    "4. Remove All Stopped Containers\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
+
+_IMAGE_MENU = (
+    "\n=== Image Management ===\n"
+    "----------------------\n"
+    "1. List Images\n"
+    "2. Remove Image(s)\n"
+    "3. Remove All Dangling Images\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
+
+_SERVICE_MENU = (
+    "\n=== Service Management ===\n"
+    "--------------------------\n"
+    "1. Check Service Status\n"
+    "2. Start Service\n"
+    "3. Stop Service\n"
+    "4. Restart Service\n"
+    "5. Enable Service\n"
+    "6. Disable Service\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
+
+_SOCKET_MENU = (
+    "\n=== Socket Management ===\n"
+    "-------------------------\n"
+    "1. Check Socket Status\n"
+    "2. Start Socket\n"
+    "3. Stop Socket\n"
+    "4. Restart Socket\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
+
+_SYSTEM_INFO_MENU = (
+    "\n=== System Information ===\n"
+    "-------------------------\n"
+    "1. Show Docker Info\n"
+    "2. Show System Resources\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
+
+_HEALTH_REPORT_MENU = (
+    "\n=== Health Report ===\n"
+    "-------------------\n"
+    "1. Generate Full Report\n"
+    "2. Generate Quick Report\n"
+    "b. Back to Main Menu\n"
+    "q. Quit\n"
+)
 
 def setup_argparse() -> argparse.ArgumentParser:
     """Set up command line argument parser."""
@@ -68,10 +167,7 @@ def process_args(args: argparse.Namespace) -> int:
         Exit code (0 for success, non-zero for error)
     """
     try:
-        if args.interactive or not args.demo:
-            return run_interactive_mode(args.demo)
-        else:
-            return run_demo_mode()
+        return run_interactive_mode(demo_mode=args.demo)
     except KeyboardInterrupt:
         print_status("Operation cancelled by user", "warning")
         return 1
@@ -90,140 +186,148 @@ def run_interactive_mode(demo_mode: bool = False) -> int:
     """
     show_banner()
     
-    # Initialize managers
+    # Initialize managers with one shared Docker client
+    client = None if demo_mode else get_docker_client()
     service_manager = DockerServiceManager(demo_mode=demo_mode)
-    container_manager = ContainerManager(demo_mode=demo_mode)
-    image_manager = ImageManager(demo_mode=demo_mode)
+    container_manager = ContainerManager(demo_mode=demo_mode, client=client)
+    image_manager = ImageManager(demo_mode=demo_mode, client=client)
     health_report = HealthReport(demo_mode=demo_mode)
     
+    actions = {
+        '1': lambda: handle_service_management(service_manager),
+        '2': lambda: handle_socket_management(service_manager),
+        '3': lambda: handle_container_management(container_manager),
+        '4': lambda: handle_image_management(image_manager),
+        '5': lambda: handle_system_info(service_manager),
+        '6': lambda: handle_health_report(health_report),
+    }
+
     while True:
-        print("\n=== Main Menu ===")
-        print("-----------------")
-        print("1. Service Management")
-        print("2. Socket Management")
-        print("3. Container Management")
-        print("4. Image Management")
-        print("5. System Information")
-        print("6. Generate Health Report")
-        print("q. Quit")
-        
+        sys.stdout.write(_MAIN_MENU)
+        sys.stdout.flush()
+
         choice = input("\nEnter your choice: ").strip().lower()
-        
+
         if choice == 'q':
             print_status("Goodbye!", "info")
             return 0
-        elif choice == '1':
-            handle_service_management(service_manager)
-        elif choice == '2':
-            handle_socket_management(service_manager)
-        elif choice == '3':
-            handle_container_management(container_manager)
-        elif choice == '4':
-            handle_image_management(image_manager)
-        elif choice == '5':
-            handle_system_info(service_manager)
-        elif choice == '6':
-            handle_health_report(health_report)
+
+        action = actions.get(choice)
+        if action is not None:
+            action()
         else:
             print_status("Invalid choice. Please try again.", "error")
 
-def handle_container_management(container_manager: ContainerManager) -> None:
-    """Handle container management menu.
-    
+def _quit() -> None:
+    """Quit the application from a submenu."""
+    print_status("Goodbye!", "info")
+    sys.exit(0)
+
+def _run_menu(menu_text: str, actions: Dict[str, Callable[[], None]]) -> None:
+    """Run a submenu loop with O(1) choice dispatch.
+
     Args:
-        container_manager: Container manager instance
+        menu_text: Precomputed menu string displayed each iteration
+        actions: Mapping of choice key to zero-argument handler; 'b'
+            (back) and 'q' (quit) are handled here
     """
     while True:
-        print("\n=== Container Management ===")
-        print("---------------------------")
-        print("1. List Running Containers")
-        print("2. List All Containers")
-        print("3. Remove Container")
-        print("4. Remove All Stopped Containers")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
+        sys.stdout.write(menu_text)
+        sys.stdout.flush()
+
         choice = input("\nEnter your choice: ").strip().lower()
-        
+
+        if choice == 'b':
+            return
         if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            containers = container_manager.list_containers(all_containers=False)
-            if containers:
-                print("\nRunning Containers:")
-                print(tabulate(containers, headers="keys", tablefmt="grid"))
-            else:
-                print_status("No running containers found.", "info")
-        elif choice == '2':
-            containers = container_manager.list_containers(all_containers=True)
-            if containers:
-                print("\nAll Containers:")
-                print(tabulate(containers, headers="keys", tablefmt="grid"))
-            else:
-                print_status("No containers found.", "info")
-        elif choice == '3':
-            container_id = input("Enter container ID or name to remove: ").strip()
-            force = input("Force remove? (y/N): ").strip().lower() == 'y'
-            if container_manager.remove_container(container_id, force):
-                print_status("Container removed successfully.", "success")
-            else:
-                print_status("Failed to remove container.", "error")
-        elif choice == '4':
-            if input("Are you sure you want to remove all stopped containers? (y/N): ").strip().lower() == 'y':
-                if container_manager.prune_containers():
-                    print_status("All stopped containers removed successfully.", "success")
-                else:
-                    print_status("Failed to remove stopped containers.", "error")
+            _quit()
+
+        action = actions.get(choice)
+        if action is not None:
+            action()
         else:
             print_status("Invalid choice. Please try again.", "error")
 
+def handle_container_management(container_manager: ContainerManager) -> None:
+    """Handle container management menu.
+
+    Args:
+        container_manager: Container manager instance
+    """
+    def _list(all_containers: bool) -> None:
+        containers = container_manager.list_containers(all_containers=all_containers)
+        if containers:
+            title = "All Containers" if all_containers else "Running Containers"
+            sys.stdout.write(f"\n{title}:\n" + render_table(containers) + "\n")
+        else:
+            print_status("No containers found." if all_containers
+                         else "No running containers found.", "info")
+        if not container_manager.demo_mode:
+            _prefetch(lambda: container_manager.list_containers(all_containers=not all_containers))
+
+    def _remove() -> None:
+        container_ids = input("Enter container ID(s) or name(s) to remove (space-separated): ").split()
+        if not container_ids:
+            print_status("No container specified.", "warning")
+            return
+        force = confirm("Force remove? (y/N): ")
+        if len(container_ids) == 1:
+            container_manager.remove_container(container_ids[0], force)
+            print_status("Container removal scheduled.", "info")
+        else:
+            container_manager.remove_containers(container_ids, force)
+            print_status(f"Removal of {len(container_ids)} containers scheduled.", "info")
+
+    def _prune() -> None:
+        if confirm("Are you sure you want to remove all stopped containers? (y/N): "):
+            until = input("Only remove stopped containers created more than this long ago (e.g. 24h, blank for all): ").strip()
+            filters = {'until': until} if until else None
+            container_manager.prune_containers(filters=filters)
+            print_status("Removal of stopped containers scheduled.", "info")
+
+    _run_menu(_CONTAINER_MENU, {
+        '1': lambda: _list(False),
+        '2': lambda: _list(True),
+        '3': _remove,
+        '4': _prune,
+    })
+
 def handle_image_management(image_manager: ImageManager) -> None:
     """Handle image management menu.
-    
+
     Args:
         image_manager: Image manager instance
     """
-    while True:
-        print("\n=== Image Management ===")
-        print("----------------------")
-        print("1. List Images")
-        print("2. Remove Image")
-        print("3. Remove All Dangling Images")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
-        choice = input("\nEnter your choice: ").strip().lower()
-        
-        if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            images = image_manager.list_images()
-            if images:
-                print("\nDocker Images:")
-                print(tabulate(images, headers="keys", tablefmt="grid"))
-            else:
-                print_status("No images found.", "info")
-        elif choice == '2':
-            image_id = input("Enter image ID or name:tag to remove: ").strip()
-            force = input("Force remove? (y/N): ").strip().lower() == 'y'
-            if image_manager.remove_image(image_id, force):
-                print_status("Image removed successfully.", "success")
-            else:
-                print_status("Failed to remove image.", "error")
-        elif choice == '3':
-            if input("Are you sure you want to remove all dangling images? (y/N): ").strip().lower() == 'y':
-                if image_manager.prune_images():
-                    print_status("All dangling images removed successfully.", "success")
-                else:
-                    print_status("Failed to remove dangling images.", "error")
+    def _list() -> None:
+        images = image_manager.list_images()
+        if images:
+            sys.stdout.write("\nDocker Images:\n" + render_table(images) + "\n")
         else:
-            print_status("Invalid choice. Please try again.", "error")
+            print_status("No images found.", "info")
+
+    def _remove() -> None:
+        image_ids = input("Enter image ID(s) or name:tag(s) to remove (space-separated): ").split()
+        if not image_ids:
+            print_status("No image specified.", "warning")
+            return
+        force = confirm("Force remove? (y/N): ")
+        if len(image_ids) == 1:
+            image_manager.remove_image(image_ids[0], force)
+            print_status("Image removal scheduled.", "info")
+        else:
+            image_manager.remove_images(image_ids, force)
+            print_status(f"Removal of {len(image_ids)} images scheduled.", "info")
+
+    def _prune() -> None:
+        if confirm("Are you sure you want to remove all dangling images? (y/N): "):
+            image_manager.prune_images()
+            print_status("Removal of dangling images scheduled.", "info")
+
+    _run_menu(_IMAGE_MENU, {
+        '1': _list,
+        '2': _remove,
+        '3': _prune,
+    })
 
 def handle_service_management(service_manager: DockerServiceManager) -> None:
     """Handle service management menu.
@@ -231,56 +335,25 @@ def handle_service_management(service_manager: DockerServiceManager) -> None:
     Args:
         service_manager: Service manager instance
     """
-    while True:
-        print("\n=== Service Management ===")
-        print("--------------------------")
-        print("1. Check Service Status")
-        print("2. Start Service")
-        print("3. Stop Service")
-        print("4. Restart Service")
-        print("5. Enable Service")
-        print("6. Disable Service")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
-        choice = input("\nEnter your choice: ").strip().lower()
-        
-        if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            success, error = service_manager.check_service_status()
-            if not success:
-                print_status(f"Error checking service status: {error}", "error")
-        elif choice == '2':
-            if service_manager.start_service():
-                print_status("Service started successfully.", "success")
-            else:
-                print_status("Failed to start service.", "error")
-        elif choice == '3':
-            if service_manager.stop_service():
-                print_status("Service stopped successfully.", "success")
-            else:
-                print_status("Failed to stop service.", "error")
-        elif choice == '4':
-            if service_manager.restart_service():
-                print_status("Service restarted successfully.", "success")
-            else:
-                print_status("Failed to restart service.", "error")
-        elif choice == '5':
-            if service_manager.enable_service():
-                print_status("Service enabled successfully.", "success")
-            else:
-                print_status("Failed to enable service.", "error")
-        elif choice == '6':
-            if service_manager.disable_service():
-                print_status("Service disabled successfully.", "success")
-            else:
-                print_status("Failed to disable service.", "error")
+    def _status() -> None:
+        success, error = service_manager.check_service_status()
+        if not success:
+            print_status(f"Error checking service status: {error}", "error")
+
+    def _do(operation: Callable[[], bool], verb: str) -> None:
+        if operation():
+            print_status(f"Service {verb}d successfully.", "success")
         else:
-            print_status("Invalid choice. Please try again.", "error")
+            print_status(f"Failed to {verb} service.", "error")
+
+    _run_menu(_SERVICE_MENU, {
+        '1': _status,
+        '2': lambda: _do(service_manager.start_service, "start"),
+        '3': lambda: _do(service_manager.stop_service, "stop"),
+        '4': lambda: _do(service_manager.restart_service, "restart"),
+        '5': lambda: _do(service_manager.enable_service, "enable"),
+        '6': lambda: _do(service_manager.disable_service, "disable"),
+    })
 
 def handle_socket_management(service_manager: DockerServiceManager) -> None:
     """Handle socket management menu.
@@ -288,44 +361,23 @@ def handle_socket_management(service_manager: DockerServiceManager) -> None:
     Args:
         service_manager: Service manager instance
     """
-    while True:
-        print("\n=== Socket Management ===")
-        print("-------------------------")
-        print("1. Check Socket Status")
-        print("2. Start Socket")
-        print("3. Stop Socket")
-        print("4. Restart Socket")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
-        choice = input("\nEnter your choice: ").strip().lower()
-        
-        if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            success, error = service_manager.check_socket_status()
-            if not success:
-                print_status(f"Error checking socket status: {error}", "error")
-        elif choice == '2':
-            if service_manager.start_socket():
-                print_status("Socket started successfully.", "success")
-            else:
-                print_status("Failed to start socket.", "error")
-        elif choice == '3':
-            if service_manager.stop_socket():
-                print_status("Socket stopped successfully.", "success")
-            else:
-                print_status("Failed to stop socket.", "error")
-        elif choice == '4':
-            if service_manager.restart_socket():
-                print_status("Socket restarted successfully.", "success")
-            else:
-                print_status("Failed to restart socket.", "error")
+    def _status() -> None:
+        success, error = service_manager.check_socket_status()
+        if not success:
+            print_status(f"Error checking socket status: {error}", "error")
+
+    def _do(operation: Callable[[], bool], verb: str) -> None:
+        if operation():
+            print_status(f"Socket {verb}d successfully.", "success")
         else:
-            print_status("Invalid choice. Please try again.", "error")
+            print_status(f"Failed to {verb} socket.", "error")
+
+    _run_menu(_SOCKET_MENU, {
+        '1': _status,
+        '2': lambda: _do(service_manager.start_socket, "start"),
+        '3': lambda: _do(service_manager.stop_socket, "stop"),
+        '4': lambda: _do(service_manager.restart_socket, "restart"),
+    })
 
 def handle_system_info(service_manager: DockerServiceManager) -> None:
     """Handle system information menu.
@@ -333,31 +385,20 @@ def handle_system_info(service_manager: DockerServiceManager) -> None:
     Args:
         service_manager: Service manager instance
     """
-    while True:
-        print("\n=== System Information ===")
-        print("-------------------------")
-        print("1. Show Docker Info")
-        print("2. Show System Resources")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
-        choice = input("\nEnter your choice: ").strip().lower()
-        
-        if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            success, error = service_manager.show_docker_info()
-            if not success:
-                print_status(f"Error showing Docker info: {error}", "error")
-        elif choice == '2':
-            success, error = service_manager.show_system_resources()
-            if not success:
-                print_status(f"Error showing system resources: {error}", "error")
-        else:
-            print_status("Invalid choice. Please try again.", "error")
+    def _docker_info() -> None:
+        success, error = service_manager.show_docker_info()
+        if not success:
+            print_status(f"Error showing Docker info: {error}", "error")
+
+    def _system_resources() -> None:
+        success, error = service_manager.show_system_resources()
+        if not success:
+            print_status(f"Error showing system resources: {error}", "error")
+
+    _run_menu(_SYSTEM_INFO_MENU, {
+        '1': _docker_info,
+        '2': _system_resources,
+    })
 
 def handle_health_report(health_report: HealthReport) -> None:
     """Handle health report menu.
@@ -365,40 +406,20 @@ def handle_health_report(health_report: HealthReport) -> None:
     Args:
         health_report: Health report instance
     """
-    while True:
-        print("\n=== Health Report ===")
-        print("-------------------")
-        print("1. Generate Full Report")
-        print("2. Generate Quick Report")
-        print("b. Back to Main Menu")
-        print("q. Quit")
-        
-        choice = input("\nEnter your choice: ").strip().lower()
-        
-        if choice == 'q':
-            print_status("Goodbye!", "info")
-            sys.exit(0)
-        elif choice == 'b':
-            break
-        elif choice == '1':
-            success, error = health_report.generate_full_report()
-            if not success:
-                print_status(f"Error generating full report: {error}", "error")
-        elif choice == '2':
-            success, error = health_report.generate_quick_report()
-            if not success:
-                print_status(f"Error generating quick report: {error}", "error")
-        else:
-            print_status("Invalid choice. Please try again.", "error")
+    def _full_report() -> None:
+        success, error = health_report.generate_full_report()
+        if not success:
+            print_status(f"Error generating full report: {error}", "error")
 
-def run_demo_mode() -> int:
-    """Run the application in demo mode.
-    
-    Returns:
-        Exit code (0 for success, non-zero for error)
-    """
-    print("\033[93mDEMO MODE\033[0m: Running with simulated responses")
-    return run_interactive_mode(demo_mode=True)
+    def _quick_report() -> None:
+        success, error = health_report.generate_quick_report()
+        if not success:
+            print_status(f"Error generating quick report: {error}", "error")
+
+    _run_menu(_HEALTH_REPORT_MENU, {
+        '1': _full_report,
+        '2': _quick_report,
+    })
 
 def main() -> int:
     """Main entry point for the CLI.
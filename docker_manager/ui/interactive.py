@@ -1,17 +1,58 @@
 """
 Interactive console UI for Docker service manager.
 """
+import contextlib
+import io
 import os
+import select
 import sys
+import threading
 import time
-from typing import List, Dict, Callable, Any, Optional
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import List, Dict, Callable, Any, Optional, Tuple
 
 from ..core.service_manager import DockerServiceManager
-from ..core.health_report import HealthReport
-from ..core.container_visualization import ContainerVisualizer
-from ..utils.display import COLORS, get_terminal_size, show_banner, print_status, print_section
+from ..utils.display import COLORS, get_terminal_size, show_banner, print_status, print_section, write_raw
 from .onboarding import OnboardingManager
 
+# Bound once so menu rendering skips the per-option dict lookups
+_CYAN = COLORS['CYAN']
+_RESET = COLORS['RESET']
+
+# Frames cycled through while background work is in flight
+_SPINNER_FRAMES = "|/-\\"
+
+# Immutable menu records: attribute access is a C-level offset and the
+# entries carry no per-instance __dict__
+Option = namedtuple("Option", "key desc action")
+Menu = namedtuple("Menu", "title options dispatch rendered rendered_bytes")
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Routes writes to a per-thread buffer so concurrent print-based
+    manager calls don't interleave their output.
+
+    Threads that never registered a buffer fall through to the real
+    stream.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer) -> None:
+        """Direct the current thread's writes into the given buffer."""
+        self._local.buffer = buffer
+
+    def write(self, s: str) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(s)
+
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self._fallback).flush()
+
 class InteractiveConsole:
     """Interactive console interface for Docker service management."""
     
@@ -21,80 +62,243 @@ class InteractiveConsole:
         Args:
             demo_mode: Whether to use demo mode for Docker operations
         """
+        # Windows consoles often leave stdout unbuffered, making every
+        # print a separate syscall; line buffering batches them
+        try:
+            sys.stdout.reconfigure(line_buffering=True)
+        except (AttributeError, ValueError):
+            pass
         self.manager = DockerServiceManager(demo_mode=demo_mode)
         self.onboarding = OnboardingManager(demo_mode=demo_mode)
+        # The matplotlib-heavy helpers are built lazily on first use
+        # (see the visualizer / health_reporter properties) and then
+        # reused, so startup doesn't pay their import cost
+        self._visualizer = None
+        self._health_reporter = None
         self.demo_mode = demo_mode
         self.running = True
         self.current_menu = "main"
+        if os.name == 'nt':
+            # Enable ANSI escape processing in the Windows console so the
+            # escape-based screen clear works there too
+            os.system("")
+        # Banner output never changes; capture it once so redraws are a
+        # single write instead of re-rendering every loop iteration
+        self._banner_cached = self._capture(show_banner)
+        self._banner_bytes = self._banner_cached.encode("utf-8")
+        # Short-lived cache of the container list: (timestamp, containers)
+        self._containers_cache = (0.0, None)
+        # Single worker used to bound how long menu actions may block
+        self._deadline_pool = ThreadPoolExecutor(max_workers=1)
+        # Workers for long-running jobs (report generation, visualization)
+        self._bg = ThreadPoolExecutor(max_workers=2)
+        # In-flight background futures whose spinner is advanced while
+        # the input loop waits for a keypress
+        self._background_futures: List[Any] = []
+        self._spinner_i = 0
+        # Redraw the menu only when it changed; invalid keypresses just
+        # re-emit the prompt instead of a full clear + redraw
+        self._menu_dirty = True
         self.menus = self._create_menus()
 
-    def _create_menus(self) -> Dict[str, Dict[str, Any]]:
+    # How long the cached container list stays fresh, in seconds
+    CONTAINERS_CACHE_TTL = 1.0
+
+    # Hard deadline for daemon calls made from menu actions, in seconds
+    DEADLINE_SECONDS = 5.0
+
+    @property
+    def visualizer(self):
+        """Container visualizer, imported and built on first access.
+
+        The import pulls in matplotlib (several hundred ms), so it is
+        deferred until the user actually asks for a visualization.
+        """
+        if self._visualizer is None:
+            from ..core.container_visualization import ContainerVisualizer
+            self._visualizer = ContainerVisualizer(demo_mode=self.demo_mode)
+        return self._visualizer
+
+    @property
+    def health_reporter(self):
+        """Health reporter, imported and built on first access."""
+        if self._health_reporter is None:
+            from ..core.health_report import HealthReport
+            self._health_reporter = HealthReport(demo_mode=self.demo_mode)
+        return self._health_reporter
+
+    def _call_with_deadline(self, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """Run a blocking manager call with a hard deadline.
+
+        Keeps the console responsive when the daemon hangs: the call runs
+        on a worker thread and, if it misses the deadline, False is
+        returned while the call is left to finish in the background.
+
+        Args:
+            fn: Zero-argument manager call to run
+            timeout: Deadline in seconds (defaults to DEADLINE_SECONDS)
+
+        Returns:
+            The call's result, or False on timeout
+        """
+        if timeout is None:
+            timeout = self.DEADLINE_SECONDS
+
+        future = self._deadline_pool.submit(fn)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            print_status(
+                f"Operation timed out after {timeout:.0f}s; it may still complete in the background",
+                "warning"
+            )
+            return False
+
+    def _run_in_background(self, job: Callable[[], Any]) -> Any:
+        """Run a long job off the UI thread, showing a spinner meanwhile.
+
+        Args:
+            job: Zero-argument callable to run on the background pool
+
+        Returns:
+            The job's result
+        """
+        future = self._bg.submit(job)
+        self._background_futures.append(future)
+        while not future.done():
+            self._tick_background()
+            time.sleep(0.1)
+        self._tick_background()
+        return future.result()
+
+    def _tick_background(self) -> None:
+        """Advance the spinner for any in-flight background work.
+
+        Called from the input loop between polls so background jobs get
+        visible progress without a dedicated drawing thread; clears the
+        spinner character once everything has finished.
+        """
+        if not self._background_futures:
+            return
+        if any(not future.done() for future in self._background_futures):
+            sys.stdout.write("\r" + _SPINNER_FRAMES[self._spinner_i & 3])
+            self._spinner_i += 1
+        else:
+            self._background_futures.clear()
+            sys.stdout.write("\r \r")
+        sys.stdout.flush()
+
+    def _get_containers_cached(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the container list, reusing a recent result when fresh.
+
+        Returns:
+            List of container dictionaries from the service manager
+        """
+        now = time.monotonic()
+        timestamp, containers = self._containers_cache
+        if containers is not None and now - timestamp < self.CONTAINERS_CACHE_TTL:
+            return containers
+
+        containers = self._call_with_deadline(self.manager.get_containers)
+        if containers is False:
+            return None
+        self._containers_cache = (now, containers)
+        return containers
+
+    def _invalidate_containers_cache(self) -> None:
+        """Drop the cached container list after a state-changing action."""
+        self._containers_cache = (0.0, None)
+
+    @staticmethod
+    def _capture(render: Callable[..., None], *args: Any) -> str:
+        """Capture the stdout produced by a print-based renderer.
+
+        Args:
+            render: Function that prints to stdout
+            *args: Arguments passed through to the renderer
+
+        Returns:
+            Everything the renderer wrote, as a string
+        """
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            render(*args)
+        return buffer.getvalue()
+
+    def _create_menus(self) -> Dict[str, Menu]:
         """Create menu structure with options and actions.
-        
+
         Returns:
-            Dictionary of menus with their options and associated actions
+            Dictionary of Menu records with their options and actions
         """
-        return {
-            "main": {
-                "title": "Main Menu",
-                "options": [
-                    {"key": "1", "desc": "Service Management", "action": lambda: self._change_menu("service")},
-                    {"key": "2", "desc": "Socket Management", "action": lambda: self._change_menu("socket")},
-                    {"key": "3", "desc": "Container Management", "action": lambda: self._change_menu("container")},
-                    {"key": "4", "desc": "System Information", "action": lambda: self._change_menu("info")},
-                    {"key": "5", "desc": "Generate Health Report", "action": self._generate_health_report},
-                    {"key": "q", "desc": "Quit", "action": self._quit},
-                ],
-            },
-            "service": {
-                "title": "Service Management",
-                "options": [
-                    {"key": "1", "desc": "Check Service Status", "action": self._check_service_status},
-                    {"key": "2", "desc": "Start Service", "action": self._start_service},
-                    {"key": "3", "desc": "Stop Service", "action": self._stop_service},
-                    {"key": "4", "desc": "Restart Service", "action": self._restart_service},
-                    {"key": "5", "desc": "Enable Service", "action": self._enable_service},
-                    {"key": "6", "desc": "Disable Service", "action": self._disable_service},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")},
-                    {"key": "q", "desc": "Quit", "action": self._quit},
-                ],
-            },
-            "socket": {
-                "title": "Socket Management",
-                "options": [
-                    {"key": "1", "desc": "Check Socket Status", "action": self._check_socket_status},
-                    {"key": "2", "desc": "Start Socket", "action": self._start_socket},
-                    {"key": "3", "desc": "Stop Socket", "action": self._stop_socket},
-                    {"key": "4", "desc": "Enable Socket", "action": self._enable_socket},
-                    {"key": "5", "desc": "Disable Socket", "action": self._disable_socket},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")},
-                    {"key": "q", "desc": "Quit", "action": self._quit},
-                ],
-            },
-            "container": {
-                "title": "Container Management",
-                "options": [
-                    {"key": "1", "desc": "List Containers", "action": self._list_containers},
-                    {"key": "2", "desc": "View Container Logs", "action": self._view_container_logs},
-                    {"key": "3", "desc": "Visualize Containers", "action": self._visualize_containers},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")},
-                    {"key": "q", "desc": "Quit", "action": self._quit},
-                ],
-            },
-            "info": {
-                "title": "System Information",
-                "options": [
-                    {"key": "1", "desc": "Show Docker Info", "action": self._show_docker_info},
-                    {"key": "2", "desc": "Check Privileges", "action": self._check_privileges},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")},
-                    {"key": "q", "desc": "Quit", "action": self._quit},
-                ],
-            },
+        specs = {
+            "main": ("Main Menu", (
+                Option("1", "Service Management", partial(self._change_menu, "service")),
+                Option("2", "Socket Management", partial(self._change_menu, "socket")),
+                Option("3", "Container Management", partial(self._change_menu, "container")),
+                Option("4", "System Information", partial(self._change_menu, "info")),
+                Option("5", "Generate Health Report", self._generate_health_report),
+                Option("q", "Quit", self._quit),
+            )),
+            "service": ("Service Management", (
+                Option("1", "Check Service Status", self._check_service_status),
+                Option("2", "Start Service", self._start_service),
+                Option("3", "Stop Service", self._stop_service),
+                Option("4", "Restart Service", self._restart_service),
+                Option("5", "Enable Service", self._enable_service),
+                Option("6", "Disable Service", self._disable_service),
+                Option("b", "Back to Main Menu", partial(self._change_menu, "main")),
+                Option("q", "Quit", self._quit),
+            )),
+            "socket": ("Socket Management", (
+                Option("1", "Check Socket Status", self._check_socket_status),
+                Option("2", "Start Socket", self._start_socket),
+                Option("3", "Stop Socket", self._stop_socket),
+                Option("4", "Enable Socket", self._enable_socket),
+                Option("5", "Disable Socket", self._disable_socket),
+                Option("b", "Back to Main Menu", partial(self._change_menu, "main")),
+                Option("q", "Quit", self._quit),
+            )),
+            "container": ("Container Management", (
+                Option("1", "List Containers", self._list_containers),
+                Option("2", "View Container Logs", self._view_container_logs),
+                Option("3", "Visualize Containers", self._visualize_containers),
+                Option("b", "Back to Main Menu", partial(self._change_menu, "main")),
+                Option("q", "Quit", self._quit),
+            )),
+            "info": ("System Information", (
+                Option("1", "Show Docker Info", self._show_docker_info),
+                Option("2", "Check Privileges", self._check_privileges),
+                Option("3", "Dashboard", self._dashboard),
+                Option("b", "Back to Main Menu", partial(self._change_menu, "main")),
+                Option("q", "Quit", self._quit),
+            )),
         }
 
+        # Pre-render each menu (section header, options, prompt) so
+        # _display_menu can emit one string per redraw, and build the
+        # key -> action dispatch table for O(1) choice lookup
+        menus = {}
+        for name, (title, options) in specs.items():
+            dispatch = {option.key: option.action for option in options}
+            rendered = self._capture(print_section, title) + "\n".join(
+                f"{_CYAN}{option.key}{_RESET}. {option.desc}"
+                for option in options
+            ) + "\n\nEnter your choice: "
+            # Pre-encode so each redraw skips the text-layer UTF-8 encode
+            menus[name] = Menu(title, options, dispatch, rendered,
+                               rendered.encode("utf-8"))
+
+        return menus
+
     def _clear_screen(self) -> None:
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen with an ANSI escape write.
+
+        Avoids forking a shell subprocess (cls/clear) on every menu
+        change.
+        """
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
     def _change_menu(self, menu_name: str) -> None:
         """Change the current menu.
@@ -105,55 +309,108 @@ class InteractiveConsole:
         if menu_name in self.menus:
             self.current_menu = menu_name
             self._clear_screen()
+            self._menu_dirty = True
         else:
             print_status(f"Invalid menu: {menu_name}", "error")
 
     def _display_menu(self) -> None:
-        """Display the current menu."""
-        show_banner()
-        
-        menu = self.menus[self.current_menu]
-        print_section(menu["title"])
-        
-        for option in menu["options"]:
-            print(f"{COLORS['CYAN']}{option['key']}{COLORS['RESET']}. {option['desc']}")
-        
-        print("\nEnter your choice: ", end="", flush=True)
+        """Display the current menu with a single raw write.
+
+        The banner and menu bytes are pre-encoded, so a redraw is one
+        os.write with no UTF-8 encode step (write_raw falls back to the
+        text layer when stdout is captured).
+        """
+        sys.stdout.flush()
+        write_raw(self._banner_bytes + self.menus[self.current_menu].rendered_bytes)
+        self._menu_dirty = False
 
     def _get_input(self) -> str:
-        """Get user input.
-        
+        """Get user input, polling so background work stays visible.
+
+        Waits for a line with select (or kbhit on Windows) on a short
+        timeout, ticking the spinner between polls so long-running
+        Docker calls keep giving feedback. Falls back to blocking
+        input() when stdin is not a terminal (pipes, test capture).
+
         Returns:
             User's input choice
         """
         try:
-            return input().strip().lower()
+            if os.name == 'nt':
+                return self._get_input_windows()
+            if not sys.stdin.isatty():
+                return input().strip().lower()
+            while self.running:
+                readable, _, _ = select.select([sys.stdin], [], [], 0.1)
+                if readable:
+                    line = sys.stdin.readline()
+                    if not line:
+                        return "q"
+                    return line.strip().lower()
+                self._tick_background()
+            return "q"
         except (EOFError, KeyboardInterrupt):
             return "q"
 
+    def _get_input_windows(self) -> str:
+        """Poll for a line of input on Windows, where select() can't
+        watch stdin; characters are echoed as they arrive.
+
+        Returns:
+            User's input choice
+        """
+        import msvcrt
+        chars: List[str] = []
+        while self.running:
+            if msvcrt.kbhit():
+                ch = msvcrt.getwch()
+                if ch in ('\r', '\n'):
+                    sys.stdout.write('\n')
+                    sys.stdout.flush()
+                    return ''.join(chars).strip().lower()
+                if ch == '\x03':  # Ctrl-C
+                    return "q"
+                if ch == '\x08':  # Backspace
+                    if chars:
+                        chars.pop()
+                        sys.stdout.write('\b \b')
+                else:
+                    chars.append(ch)
+                    sys.stdout.write(ch)
+                sys.stdout.flush()
+            else:
+                self._tick_background()
+                time.sleep(0.1)
+        return "q"
+
     def _process_action(self, choice: str) -> None:
         """Process the user's menu choice.
         
         Args:
             choice: User's input choice
         """
-        menu = self.menus[self.current_menu]
-        
-        for option in menu["options"]:
-            if option["key"] == choice:
-                try:
-                    option["action"]()
-                except Exception as e:
-                    print_status(f"Error executing action: {str(e)}", "error")
-                    if self.demo_mode:
-                        print("Try running without --demo flag")
-                return
-        
-        print_status("Invalid choice", "error")
+        action = self.menus[self.current_menu].dispatch.get(choice)
+        if action is None:
+            # Re-prompt in place rather than clearing and redrawing the
+            # whole unchanged menu
+            print_status("Invalid choice", "error")
+            sys.stdout.write("\nEnter your choice: ")
+            sys.stdout.flush()
+            return
+
+        try:
+            action()
+        except Exception as e:
+            print_status(f"Error executing action: {str(e)}", "error")
+            if self.demo_mode:
+                print("Try running without --demo flag")
+        # Action output landed below the menu, so redraw it next loop
+        self._menu_dirty = True
 
     def _quit(self) -> None:
         """Quit the application."""
         self.running = False
+        self._bg.shutdown(wait=False)
         print_status("Goodbye!", "info")
 
     def _handle_action_result(self, success: bool, action_name: str, error_code: Optional[str] = None) -> None:
@@ -175,27 +432,49 @@ class InteractiveConsole:
             if self.demo_mode:
                 print("Try running without --demo flag")
 
+    @staticmethod
+    def _unpack_result(result: Any) -> Tuple[bool, Optional[str]]:
+        """Normalize a manager call's return value.
+
+        Most daemon calls return a (success, error_code) tuple, while a
+        deadline timeout surfaces as a bare False; treating the tuple as
+        a plain boolean would read (False, error_code) as truthy.
+
+        Args:
+            result: Raw return value from the manager call
+
+        Returns:
+            Tuple of (success, error_code)
+        """
+        if isinstance(result, tuple):
+            return result
+        return result, None
+
     def _check_service_status(self) -> None:
         """Check Docker service status."""
-        success = self.manager.get_status()
-        self._handle_action_result(success, "Service status check")
-        
+        success, error_code = self._unpack_result(
+            self._call_with_deadline(self.manager.get_status))
+        self._handle_action_result(success, "Service status check", error_code)
+
         if success:
             input("\nPress Enter to continue...")
 
     def _start_service(self) -> None:
         """Start Docker service."""
         success = self.manager.start_service()
+        self._invalidate_containers_cache()
         self._handle_action_result(success, "Service start")
 
     def _stop_service(self) -> None:
         """Stop Docker service."""
         success = self.manager.stop_service()
+        self._invalidate_containers_cache()
         self._handle_action_result(success, "Service stop")
 
     def _restart_service(self) -> None:
         """Restart Docker service."""
         success = self.manager.restart_service()
+        self._invalidate_containers_cache()
         self._handle_action_result(success, "Service restart")
 
     def _enable_service(self) -> None:
@@ -210,9 +489,10 @@ class InteractiveConsole:
 
     def _check_socket_status(self) -> None:
         """Check Docker socket status."""
-        success = self.manager.get_socket_status()
-        self._handle_action_result(success, "Socket status check")
-        
+        success, error_code = self._unpack_result(
+            self._call_with_deadline(self.manager.get_socket_status))
+        self._handle_action_result(success, "Socket status check", error_code)
+
         if success:
             input("\nPress Enter to continue...")
 
@@ -238,26 +518,29 @@ class InteractiveConsole:
 
     def _list_containers(self) -> None:
         """List Docker containers."""
-        success = self.manager.list_containers()
-        self._handle_action_result(success, "Container listing")
-        
+        success, error_code = self._unpack_result(
+            self._call_with_deadline(self.manager.list_containers))
+        self._handle_action_result(success, "Container listing", error_code)
+
         if success:
             input("\nPress Enter to continue...")
 
     def _view_container_logs(self) -> None:
         """View container logs."""
-        # Get list of containers
-        containers = self.manager.get_containers()
+        # Get list of containers (cached briefly across menu re-entries)
+        containers = self._get_containers_cached()
         if not containers:
             print_status("No containers found", "warning")
             return
             
-        # Display container list
+        # Display container list in one write instead of a print per line
         print_section("Available Containers")
-        for i, container in enumerate(containers, 1):
-            name = container.get("name", container.get("id", "Unknown"))
-            status = container.get("status", "Unknown")
-            print(f"{i}. {name} ({status})")
+        sys.stdout.write("\n".join(
+            f"{i}. {container.get('name', container.get('id', 'Unknown'))} "
+            f"({container.get('status', 'Unknown')})"
+            for i, container in enumerate(containers, 1)
+        ) + "\n")
+        sys.stdout.flush()
             
         # Get container selection
         try:
@@ -290,8 +573,7 @@ class InteractiveConsole:
     def _visualize_containers(self) -> None:
         """Visualize container metrics."""
         try:
-            visualizer = ContainerVisualizer(demo_mode=self.demo_mode)
-            success = visualizer.generate_visualizations()
+            success = self._run_in_background(self.visualizer.generate_visualizations)
             self._handle_action_result(success, "Container visualization")
             
             if success:
@@ -301,12 +583,59 @@ class InteractiveConsole:
 
     def _show_docker_info(self) -> None:
         """Show Docker system information."""
-        success = self.manager.check_docker_info()
-        self._handle_action_result(success, "Docker info")
-        
+        success, error_code = self._unpack_result(
+            self._call_with_deadline(self.manager.check_docker_info))
+        self._handle_action_result(success, "Docker info", error_code)
+
         if success:
             input("\nPress Enter to continue...")
 
+    def _dashboard(self) -> None:
+        """Show service, socket and daemon status side by side.
+
+        The three daemon checks are independent, so they run on their
+        own workers and the dashboard's latency is the slowest call
+        rather than the sum. Each worker's output is captured through a
+        thread-local stdout and rendered in order once all have
+        finished.
+        """
+        checks = (
+            ("Service status check", self.manager.check_service_status),
+            ("Socket status check", self.manager.get_socket_status),
+            ("Docker info", self.manager.check_docker_info),
+        )
+
+        proxy = _ThreadLocalStdout(sys.stdout)
+
+        def run_check(fn: Callable[[], Any]) -> Any:
+            buffer = io.StringIO()
+            proxy.register(buffer)
+            result = fn()
+            return result, buffer.getvalue()
+
+        sections: Dict[str, Any] = {}
+        original_stdout = sys.stdout
+        sys.stdout = proxy
+        try:
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = {pool.submit(run_check, fn): name for name, fn in checks}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        sections[name] = future.result()
+                    except Exception as e:
+                        sections[name] = ((False, None), f"Error: {e}\n")
+        finally:
+            sys.stdout = original_stdout
+
+        for name, _ in checks:
+            result, output = sections[name]
+            success, error_code = self._unpack_result(result)
+            sys.stdout.write(output)
+            self._handle_action_result(success, name, error_code)
+
+        input("\nPress Enter to continue...")
+
     def _check_privileges(self) -> None:
         """Check if user has necessary privileges."""
         success = self.manager.check_privileges()
@@ -315,8 +644,7 @@ class InteractiveConsole:
     def _generate_health_report(self) -> None:
         """Generate system health report."""
         try:
-            health_reporter = HealthReport(demo_mode=self.demo_mode)
-            success = health_reporter.generate_report()
+            success = self._run_in_background(self.health_reporter.generate_report)
             self._handle_action_result(success, "Health report generation")
             
             if success:
@@ -328,7 +656,8 @@ class InteractiveConsole:
         """Run the interactive console."""
         try:
             while self.running:
-                self._display_menu()
+                if self._menu_dirty:
+                    self._display_menu()
                 choice = self._get_input()
                 self._process_action(choice)
                 
@@ -1,8 +1,10 @@
 """
 Display utilities for Docker service manager.
 """
+import io
 import os
 import shutil
+import sys
 from typing import List, Tuple, Optional, Any, Dict
 
 # ANSI color codes
@@ -102,6 +104,95 @@ def print_table(headers: List[str], rows: List[List[Any]]) -> None:
         row_formatted = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
         print(row_formatted)
 
+def confirm(prompt: str) -> bool:
+    """Ask a yes/no question, reading a single keystroke where possible.
+
+    On a POSIX TTY the terminal is put in cbreak mode so the answer
+    registers without Enter; on Windows msvcrt.getch is used. When stdin
+    is not a TTY (scripted runs, tests) this falls back to a plain
+    input() line read.
+
+    Args:
+        prompt: Question to display (should include its own (y/N) hint)
+
+    Returns:
+        True if the user answered yes
+    """
+    if not sys.stdin.isatty():
+        return input(prompt).strip().lower() == 'y'
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    if os.name == 'nt':
+        import msvcrt
+        ch = msvcrt.getch()
+        answer = ch in (b'y', b'Y')
+    else:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            ch = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        answer = ch in ('y', 'Y')
+
+    # Echo the answer plus a newline since the keystroke wasn't echoed
+    sys.stdout.write(('y' if answer else 'n') + "\n")
+    return answer
+
+def write_raw(data: bytes) -> None:
+    """Write pre-encoded bytes straight to stdout.
+
+    Bypasses print's buffering and str-to-bytes encoding for output that
+    is already encoded; falls back to the text layer when stdout has no
+    usable file descriptor (e.g. under test capture).
+
+    Args:
+        data: UTF-8 encoded bytes to write
+    """
+    try:
+        os.write(sys.stdout.fileno(), data)
+    except (OSError, ValueError, AttributeError, io.UnsupportedOperation):
+        sys.stdout.write(data.decode('utf-8'))
+        sys.stdout.flush()
+
+def render_table(rows: List[Dict[str, Any]]) -> str:
+    """Render a list of row dictionaries as a fixed-width table string.
+
+    Single-pass width computation and plain string joins; much cheaper
+    than tabulate's grid format for the hot container/image list views,
+    and works without tabulate installed.
+
+    Args:
+        rows: List of dictionaries sharing the same keys
+
+    Returns:
+        Formatted table as a single string (no trailing newline)
+    """
+    if not rows:
+        return ""
+
+    headers = list(rows[0].keys())
+    widths = [
+        max(len(header), max(len(str(row[header])) for row in rows))
+        for header in headers
+    ]
+
+    separator = "-+-".join("-" * w for w in widths)
+    lines = [
+        " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers)),
+        separator,
+    ]
+    lines.extend(
+        " | ".join(str(row[h]).ljust(widths[i]) for i, h in enumerate(headers))
+        for row in rows
+    )
+    return "\n".join(lines)
+
 def print_section(title: str) -> None:
     """Print a section title with formatting.
     
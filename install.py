@@ -13,13 +13,11 @@ import platform
 import argparse
 from pathlib import Path
 
-def is_windows():
-    """Check if running on Windows."""
-    return platform.system().lower() == 'windows'
-
-def is_unix():
-    """Check if running on Unix-like system."""
-    return platform.system().lower() in ('linux', 'darwin')
+# The platform never changes mid-run, so detect it once at import time
+# instead of calling platform.system() at every check
+_SYS = platform.system().lower()
+IS_WINDOWS = _SYS == 'windows'
+IS_UNIX = _SYS in ('linux', 'darwin')
 
 def check_python_version():
     """Check if Python version meets requirements."""
@@ -33,14 +31,17 @@ def check_python_version():
     return True
 
 def check_pip():
-    """Check if pip is installed and up to date."""
+    """Check if pip is installed and working.
+
+    The pip upgrade itself is folded into the single install invocation
+    so we don't pay an extra interpreter/pip cold start here.
+    """
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "--version"])
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
         return True
     except subprocess.CalledProcessError:
         print("Error: pip is not installed or not working correctly.")
-        if is_windows():
+        if IS_WINDOWS:
             print("Please install pip from https://pip.pypa.io/en/stable/installation/")
         else:
             print("Please install pip using your package manager:")
@@ -49,47 +50,34 @@ def check_pip():
             print("  - For macOS: brew install python3")
         return False
 
-def install_dependencies():
-    """Install required dependencies."""
-    print("Installing dependencies...")
-    
-    # Core dependencies
-    dependencies = [
-        "docker>=6.1.0",
-        "psutil>=5.9.0",
-        "tabulate>=0.9.0",
-        "matplotlib>=3.7.0",
-    ]
-    
-    # Optional dependencies
-    optional_deps = [
-        "blessed>=1.20.0",  # For TUI mode
-    ]
-    
-    try:
-        # Install core dependencies
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade"] + dependencies)
-        
-        # Install optional dependencies if requested
-        if args.with_tui:
-            subprocess.check_call([sys.executable, "-m", "pip", "install"] + optional_deps)
-        
-        print("Dependencies installed successfully.\n")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error installing dependencies: {e}")
-        return False
+# Core dependencies
+DEPENDENCIES = [
+    "docker>=6.1.0",
+    "psutil>=5.9.0",
+    "tabulate>=0.9.0",
+    "matplotlib>=3.7.0",
+]
 
-def install_package(editable=False):
-    """Install the package."""
-    print("Installing Docker Service Manager...")
-    cmd = [sys.executable, "-m", "pip", "install"]
-    
+# Optional dependencies
+OPTIONAL_DEPS = [
+    "blessed>=1.20.0",  # For TUI mode
+]
+
+def install_all(editable=False, with_tui=False):
+    """Install pip upgrade, dependencies and the package in one pip run.
+
+    A single invocation saves two to three pip cold starts and lets the
+    resolver handle everything in one pass.
+    """
+    print("Installing Docker Service Manager and dependencies...")
+
+    cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "pip"] + DEPENDENCIES
+    if with_tui:
+        cmd += OPTIONAL_DEPS
     if editable:
         cmd.append("-e")
-    
     cmd.append(".")
-    
+
     try:
         subprocess.check_call(cmd)
         print("Docker Service Manager installed successfully!\n")
@@ -102,10 +90,14 @@ def verify_installation():
     """Verify the installation by running a simple command."""
     try:
         print("Verifying installation...")
-        # Import the module to verify it's installed correctly
-        from importlib import import_module
-        import_module("docker_manager")
-        
+        # Resolving the loader is enough to prove the package is
+        # installed, without executing its (docker/matplotlib-heavy)
+        # package-level imports
+        import importlib.util
+        if importlib.util.find_spec("docker_manager") is None:
+            print("Error verifying installation: docker_manager not found")
+            return False
+
         print("Docker Service Manager has been successfully installed!")
         print("\nTo use the tool, run one of the following commands:")
         print("  docker-service-manager --help")
@@ -143,12 +135,9 @@ def main():
         sys.exit(1)
     
     try:
-        if not install_dependencies():
-            sys.exit(1)
-            
-        if not install_package(args.editable):
+        if not install_all(editable=args.editable, with_tui=args.with_tui):
             sys.exit(1)
-            
+
         if not verify_installation():
             print("\nInstallation completed with warnings. Please check the output above.")
         else:
@@ -160,7 +149,7 @@ def main():
     
     print("===============================================")
     
-    if is_windows():
+    if IS_WINDOWS:
         input("\nPress Enter to exit...")
 
 if __name__ == "__main__":
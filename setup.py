@@ -3,39 +3,44 @@ Setup configuration for Docker Service Manager.
 """
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+def _load_long_description():
+    """Read the README lazily so importing setup.py costs no disk I/O."""
+    with open("README.md", "r", encoding="utf-8") as fh:
+        return fh.read()
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+def _load_requirements():
+    """Read install requirements lazily from requirements.txt."""
+    with open("requirements.txt", "r", encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
-setup(
-    name="docker-manager",
-    version="1.0.0",
-    author="cosmic soul",
-    author_email="stallionsprite@gmail.com",
-    description="A cross-platform Docker service manager with health monitoring",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    # url="https://github.com/sunilkarkee/dkrmngrtl",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Programming Language :: Python :: 3.13",
-    ],
-    python_requires=">=3.8",
-    install_requires=requirements,
-    entry_points={
-        'console_scripts': [
-            'dsm=docker_manager:main',
+if __name__ == "__main__":
+    setup(
+        name="docker-manager",
+        version="1.0.0",
+        author="cosmic soul",
+        author_email="stallionsprite@gmail.com",
+        description="A cross-platform Docker service manager with health monitoring",
+        long_description=_load_long_description(),
+        long_description_content_type="text/markdown",
+        # url="https://github.com/sunilkarkee/dkrmngrtl",
+        packages=find_packages(include=["docker_manager", "docker_manager.*"]),
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Developers",
+            "Topic :: Software Development :: Libraries :: Python Modules",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "Programming Language :: Python :: 3.12",
+            "Programming Language :: Python :: 3.13",
         ],
-    },
-)
+        python_requires=">=3.8",
+        install_requires=_load_requirements(),
+        entry_points={
+            'console_scripts': [
+                'dsm=docker_manager:main',
+            ],
+        },
+    )
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+from docker_manager.utils.display import confirm, render_table
+
+class TestRenderTable(unittest.TestCase):
+    def test_empty_rows(self):
+        self.assertEqual(render_table([]), "")
+
+    def test_column_widths(self):
+        rows = [
+            {"ID": "abc123", "Name": "web"},
+            {"ID": "d", "Name": "database-x"},
+        ]
+        output = render_table(rows)
+        self.assertEqual(output.split("\n"), [
+            "ID     | Name      ",
+            "-------+-----------",
+            "abc123 | web       ",
+            "d      | database-x",
+        ])
+
+    def test_header_wider_than_values(self):
+        output = render_table([{"Status": "up"}])
+        self.assertEqual(output.split("\n"), [
+            "Status",
+            "------",
+            "up    ",
+        ])
+
+    def test_no_trailing_newline(self):
+        output = render_table([{"ID": "abc123"}])
+        self.assertFalse(output.endswith("\n"))
+
+class TestConfirm(unittest.TestCase):
+    """Covers the non-TTY input() fallback used by scripted runs and tests."""
+
+    def _confirm_with_input(self, answer):
+        with patch("sys.stdin") as stdin, \
+             patch("builtins.input", return_value=answer) as mock_input:
+            stdin.isatty.return_value = False
+            result = confirm("Proceed? (y/N): ")
+        mock_input.assert_called_once_with("Proceed? (y/N): ")
+        return result
+
+    def test_yes(self):
+        self.assertTrue(self._confirm_with_input("y"))
+
+    def test_yes_with_whitespace_and_case(self):
+        self.assertTrue(self._confirm_with_input(" Y "))
+
+    def test_no(self):
+        self.assertFalse(self._confirm_with_input("n"))
+
+    def test_empty_defaults_to_no(self):
+        self.assertFalse(self._confirm_with_input(""))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import importlib
+import os
+import unittest
+from unittest.mock import MagicMock
+from docker_manager.core import docker_client
+
+class TestDockerClientMemoization(unittest.TestCase):
+    def setUp(self):
+        docker_client.close_docker_client()
+        self._saved_module = docker_client._docker_module
+        self.mock_docker = MagicMock()
+        docker_client._docker_module = self.mock_docker
+
+    def tearDown(self):
+        docker_client.close_docker_client()
+        docker_client._docker_module = self._saved_module
+
+    def test_client_is_memoized(self):
+        first = docker_client.get_docker_client()
+        second = docker_client.get_docker_client()
+        self.assertIs(first, second)
+        self.mock_docker.from_env.assert_called_once_with(
+            timeout=docker_client.DOCKER_TIMEOUT)
+
+    def test_close_resets_client(self):
+        client = docker_client.get_docker_client()
+        docker_client.close_docker_client()
+        client.close.assert_called_once()
+        docker_client.get_docker_client()
+        self.assertEqual(self.mock_docker.from_env.call_count, 2)
+
+class TestDockerTimeoutParsing(unittest.TestCase):
+    """DOCKER_TIMEOUT is read from the environment at import time, so the
+    module is reloaded with a controlled environment for each case."""
+
+    def tearDown(self):
+        os.environ.pop('DCKRMGRTL_DOCKER_TIMEOUT', None)
+        importlib.reload(docker_client)
+
+    def _timeout_with_env(self, value):
+        if value is None:
+            os.environ.pop('DCKRMGRTL_DOCKER_TIMEOUT', None)
+        else:
+            os.environ['DCKRMGRTL_DOCKER_TIMEOUT'] = value
+        return importlib.reload(docker_client).DOCKER_TIMEOUT
+
+    def test_default(self):
+        self.assertEqual(self._timeout_with_env(None), 600)
+
+    def test_override(self):
+        self.assertEqual(self._timeout_with_env('42'), 42)
+
+    def test_invalid_value_falls_back_to_default(self):
+        self.assertEqual(self._timeout_with_env('soon'), 600)
+
+if __name__ == '__main__':
+    unittest.main()